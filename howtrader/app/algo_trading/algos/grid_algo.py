@@ -1,7 +1,7 @@
 from howtrader.trader.constant import Direction
 from howtrader.trader.object import TradeData, OrderData, TickData
 from howtrader.app.algo_trading import AlgoTemplate, AlgoEngine
-import math
+from math import floor, ceil
 from decimal import Decimal
 
 class GridAlgo(AlgoTemplate):
@@ -65,19 +65,19 @@ class GridAlgo(AlgoTemplate):
         self.timer_count = 0
 
         if self.vt_orderid:
-            self.cancel_all()
+            self.cancel_order(self.vt_orderid)
 
         # Calculate target volume to buy and sell
         target_buy_distance = (
             self.price - self.last_tick.ask_price_1) / self.step_price
-        target_buy_position = math.floor(
+        target_buy_position = floor(
             target_buy_distance) * self.step_volume
         target_buy_volume = target_buy_position - self.pos
 
         # Calculate target volume to sell
         target_sell_distance = (
             self.price - self.last_tick.bid_price_1) / self.step_price
-        target_sell_position = math.ceil(
+        target_sell_position = ceil(
             target_sell_distance) * self.step_volume
         target_sell_volume = self.pos - target_sell_position
 
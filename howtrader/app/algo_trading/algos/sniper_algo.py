@@ -56,7 +56,7 @@ class SniperAlgo(AlgoTemplate):
     def on_tick(self, tick: TickData):
         """"""
         if self.vt_orderid:
-            self.cancel_all()
+            self.cancel_order(self.vt_orderid)
             return
 
         if self.direction == Direction.LONG:
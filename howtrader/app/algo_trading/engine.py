@@ -134,6 +134,10 @@ class AlgoEngine(BaseEngine):
         if algo:
             algo.update_order(order)
 
+            # 委托结束后移除映射，避免长时间运行时字典无限增长
+            if not order.is_active():
+                self.orderid_algo_map.pop(order.vt_orderid)
+
     def start_algo(self, setting: dict) -> str:
         """"""
         template_name: str = setting["template_name"]
@@ -242,7 +246,7 @@ class AlgoEngine(BaseEngine):
     def write_log(self, msg: str, algo: AlgoTemplate = None) -> None:
         """"""
         if algo:
-            msg = f"{algo.algo_name}：{msg}"
+            msg = algo.log_prefix + msg
 
         log: LogData = LogData(msg=msg, gateway_name=APP_NAME)
         event: Event = Event(EVENT_ALGO_LOG, data=log)
@@ -1,4 +1,5 @@
 from typing import Dict
+from itertools import count
 from howtrader.trader.object import TickData, OrderData, TradeData, ContractData
 from howtrader.trader.constant import OrderType, Offset, Direction
 from howtrader.trader.utility import virtual
@@ -8,7 +9,10 @@ from typing import Optional
 class AlgoTemplate:
     """"""
 
-    _count: int = 0
+    _counter: count = count(1)
+    _name_prefix: str = "AlgoTemplate"
+    _parameter_names: tuple = ()
+    _setting_schema: tuple = ()
     display_name: str = ""
     default_setting: dict = {}
     variables: list = []
@@ -22,20 +26,35 @@ class AlgoTemplate:
         """构造函数"""
         self.algo_engine: "AlgoEngine" = algo_engine
         self.algo_name: str = algo_name
+        self.log_prefix: str = f"{algo_name}："
 
         self.active: bool = False
         self.active_orders: Dict[str, OrderData] = {}  # vt_orderid:order
 
         self.variables.insert(0, "active")
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """每个算法类独立计数，并缓存名称前缀和参数信息"""
+        super().__init_subclass__(**kwargs)
+        cls._counter = count(1)
+        cls._name_prefix = cls.__name__
+        cls._parameter_names = tuple(cls.default_setting)
+        cls._setting_schema = tuple(
+            (name, value, type(value)) for name, value in cls.default_setting.items()
+        )
+
     @classmethod
     def new(cls, algo_engine: "AlgoEngine", setting: dict) -> "AlgoTemplate":
         """创建一个新的算法实例"""
-        cls._count += 1
-        algo_name: str = f"{cls.__name__}_{cls._count}"
+        algo_name: str = f"{cls._name_prefix}_{next(cls._counter)}"
         algo = cls(algo_engine, algo_name, setting)
         return algo
 
+    @classmethod
+    def get_setting_schema(cls) -> tuple:
+        """获取缓存的参数信息，每项为(参数名, 默认值, 参数类型)"""
+        return cls._setting_schema
+
     def update_tick(self, tick: TickData) -> None:
         """"""
         if self.active:
@@ -45,8 +64,8 @@ class AlgoTemplate:
         """"""
         if order.is_active():
             self.active_orders[order.vt_orderid] = order
-        elif order.vt_orderid in self.active_orders:
-            self.active_orders.pop(order.vt_orderid)
+        else:
+            self.active_orders.pop(order.vt_orderid, None)
 
         self.on_order(order)
 
@@ -183,9 +202,7 @@ class AlgoTemplate:
 
     def put_parameters_event(self) -> None:
         """"""
-        parameters: dict = {}
-        for name in self.default_setting.keys():
-            parameters[name] = getattr(self, name)
+        parameters: dict = {name: getattr(self, name) for name in self._parameter_names}
 
         self.algo_engine.put_parameters_event(self, parameters)
 
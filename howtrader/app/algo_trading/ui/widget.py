@@ -1,11 +1,11 @@
 import csv
-from functools import partial
-from datetime import datetime
-from typing import Any, Dict, Optional
+from collections import deque
+import time
+from typing import Any, Dict, List, Optional
 
 from howtrader.event import EventEngine, Event
 from howtrader.trader.engine import MainEngine
-from howtrader.trader.ui import QtWidgets, QtCore
+from howtrader.trader.ui import QtWidgets, QtCore, QtGui
 
 from ..engine import (
     AlgoEngine,
@@ -32,9 +32,10 @@ class AlgoWidget(QtWidgets.QWidget):
 
         self.algo_engine: AlgoEngine = algo_engine
         self.template_name: str = algo_template.__name__
-        self.default_setting: dict = algo_template.default_setting
+        self.setting_schema: tuple = algo_template.get_setting_schema()
 
         self.widgets: dict = {}
+        self.converters: list = []
 
         self.init_ui()
 
@@ -44,20 +45,23 @@ class AlgoWidget(QtWidgets.QWidget):
 
         form: QtWidgets.QFormLayout = QtWidgets.QFormLayout()
 
-        for field_name, field_value in self.default_setting.items():
-            field_type: Any = type(field_value)
-
+        for field_name, field_value, field_type in self.setting_schema:
             if field_type == list:
                 widget: QtWidgets.QComboBox = QtWidgets.QComboBox()
                 widget.addItems(field_value)
+                converter: Any = str
             else:
                 widget: QtWidgets.QLineEdit = QtWidgets.QLineEdit()
+                converter: Any = field_type
 
             display_name: str = NAME_DISPLAY_MAP.get(field_name, field_name)
 
             form.addRow(display_name, widget)
             self.widgets[field_name] = (widget, field_type)
 
+            # 下拉框字段直接使用文本，其余字段按默认值类型转换
+            self.converters.append((field_name, converter))
+
         start_algo_button: QtWidgets.QPushButton = QtWidgets.QPushButton("启动算法")
         start_algo_button.clicked.connect(self.start_algo)
         form.addRow(start_algo_button)
@@ -99,51 +103,58 @@ class AlgoWidget(QtWidgets.QWidget):
         if not path:
             return
 
-        # 创建csv DictReader
-        with open(path, "r") as f:
-            buf: list = [line for line in f]
-            reader: csv.DictReader = csv.DictReader(buf)
+        # 创建csv reader，直接从文件流式读取
+        with open(path, "r", newline="", buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            header: list = next(reader, [])
+
+            # 检查csv文件是否有字段缺失
+            for field_name in self.widgets.keys():
+                if field_name not in header:
+                    QtWidgets.QMessageBox.warning(
+                        self,
+                        "字段缺失",
+                        f"CSV文件缺失算法{self.template_name}所需字段{field_name}"
+                    )
+                    return
+
+            # 预先计算每个字段所在的列位置
+            columns: list = [header.index(field_name) for field_name in self.widgets.keys()]
+
+            settings: list = []
 
-        # 检查csv文件是否有字段缺失
-        for field_name in self.widgets.keys():
-            if field_name not in reader.fieldnames:
+            try:
+                for row in reader:
+                    # 跳过空行
+                    if not row:
+                        continue
+
+                    # 用模版名初始化算法配置
+                    setting: dict = {
+                        "template_name": self.template_name
+                    }
+
+                    # 读取csv文件每行中各个字段内容
+                    field_texts: list = [row[i] for i in columns]
+                    for (field_name, field_type), field_text in zip(self.converters, field_texts):
+                        setting[field_name] = field_type(field_text)
+
+                    # 将setting添加到settings
+                    settings.append(setting)
+            except IndexError:
                 QtWidgets.QMessageBox.warning(
                     self,
                     "字段缺失",
-                    f"CSV文件缺失算法{self.template_name}所需字段{field_name}"
+                    f"CSV文件第{reader.line_num}行字段数量不足，请检查！"
+                )
+                return
+            except ValueError:
+                QtWidgets.QMessageBox.warning(
+                    self,
+                    "参数错误",
+                    f"{field_name}参数类型应为{field_type}，请检查！"
                 )
                 return
-
-        settings: list = []
-
-        for d in reader:
-            # 用模版名初始化算法配置
-            setting: dict = {
-                "template_name": self.template_name
-            }
-
-            # 读取csv文件每行中各个字段内容
-            for field_name, tp in self.widgets.items():
-                field_type: Any = tp[-1]
-                field_text: str = d[field_name]
-
-                if field_type == list:
-                    field_value = field_text
-                else:
-                    try:
-                        field_value = field_type(field_text)
-                    except ValueError:
-                        QtWidgets.QMessageBox.warning(
-                            self,
-                            "参数错误",
-                            f"{field_name}参数类型应为{field_type}，请检查！"
-                        )
-                        return
-
-                setting[field_name] = field_value
-
-            # 将setting添加到settings
-            settings.append(setting)
 
         # 当没有错误发生时启动算法
         for setting in settings:
@@ -204,7 +215,216 @@ class AlgoWidget(QtWidgets.QWidget):
             self.algo_engine.update_algo_setting(setting_name, setting)
 
 
-class AlgoMonitor(QtWidgets.QTableWidget):
+class MonitorModel(QtCore.QAbstractTableModel):
+    """监控表格数据模型，最新插入的行显示在顶部"""
+
+    def __init__(self, labels: list, parent: QtCore.QObject = None) -> None:
+        """"""
+        super().__init__(parent)
+
+        self.labels: list = labels
+
+        # 按列分别保存数据，每列按插入顺序保存，显示时倒序
+        self.columns: List[deque] = [deque() for _ in labels]
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        """"""
+        if parent.isValid():
+            return 0
+        return len(self.columns[0])
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        """"""
+        if parent.isValid():
+            return 0
+        return len(self.labels)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:
+        """"""
+        if role != QtCore.Qt.ItemDataRole.DisplayRole or not index.isValid():
+            return None
+        return self.columns[index.column()][-1 - index.row()]
+
+    def headerData(
+        self,
+        section: int,
+        orientation: QtCore.Qt.Orientation,
+        role: int = QtCore.Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        """"""
+        if (
+            role == QtCore.Qt.ItemDataRole.DisplayRole
+            and orientation == QtCore.Qt.Orientation.Horizontal
+        ):
+            return self.labels[section]
+        return None
+
+    def get_row(self, ix: int) -> int:
+        """将存储位置转换为表格中的行号"""
+        return len(self.columns[0]) - 1 - ix
+
+    def find(self, column: int, value: Any) -> Optional[int]:
+        """查找某列中数据对应的存储位置"""
+        try:
+            return self.columns[column].index(value)
+        except ValueError:
+            return None
+
+    def insert_row(self, values: list) -> int:
+        """在顶部插入一行，返回其存储位置"""
+        self.beginInsertRows(QtCore.QModelIndex(), 0, 0)
+        for column, value in zip(self.columns, values):
+            column.append(value)
+        self.endInsertRows()
+        return len(self.columns[0]) - 1
+
+    def insert_rows(self, rows: list) -> None:
+        """批量在顶部插入多行，只触发一次布局更新"""
+        if not rows:
+            return
+
+        self.beginInsertRows(QtCore.QModelIndex(), 0, len(rows) - 1)
+        for column, values in zip(self.columns, zip(*rows)):
+            column.extend(values)
+        self.endInsertRows()
+
+    def trim_rows(self, max_rows: int) -> None:
+        """移除超出上限的最早数据（位于表格底部）"""
+        size: int = len(self.columns[0])
+        count: int = size - max_rows
+        if count <= 0:
+            return
+
+        self.beginRemoveRows(QtCore.QModelIndex(), max_rows, size - 1)
+        for column in self.columns:
+            for _ in range(count):
+                column.popleft()
+        self.endRemoveRows()
+
+    def update_cell(self, ix: int, column: int, value: str) -> None:
+        """更新单元格，只通知对应单元格重绘"""
+        self.columns[column][ix] = value
+
+        index: QtCore.QModelIndex = self.index(self.get_row(ix), column)
+        self.dataChanged.emit(index, index)
+
+    def remove_row(self, ix: int) -> None:
+        """移除指定存储位置的行"""
+        row: int = self.get_row(ix)
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        for column in self.columns:
+            del column[ix]
+        self.endRemoveRows()
+
+
+class ButtonDelegate(QtWidgets.QStyledItemDelegate):
+    """在单元格中绘制按钮，点击时发出该行的名称"""
+    clicked: QtCore.pyqtSignal = QtCore.pyqtSignal(str)
+
+    pixmaps: Dict[tuple, QtGui.QPixmap] = {}
+
+    def __init__(self, text: str, name_column: int, parent: QtCore.QObject = None) -> None:
+        """"""
+        super().__init__(parent)
+
+        self.text: str = text
+        self.name_column: int = name_column
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex
+    ) -> None:
+        """"""
+        pixmap: QtGui.QPixmap = self.get_pixmap(option)
+        painter.drawPixmap(option.rect.topLeft(), pixmap)
+
+    def get_pixmap(self, option: QtWidgets.QStyleOptionViewItem) -> QtGui.QPixmap:
+        """按尺寸缓存按钮图像，所有行共用同一份"""
+        widget: Optional[QtWidgets.QWidget] = option.widget
+        ratio: float = widget.devicePixelRatioF() if widget else 1.0
+        key: tuple = (self.text, option.rect.width(), option.rect.height(), ratio)
+
+        pixmap: Optional[QtGui.QPixmap] = self.pixmaps.get(key, None)
+        if pixmap:
+            return pixmap
+
+        pixmap = QtGui.QPixmap(option.rect.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+
+        button: QtWidgets.QStyleOptionButton = QtWidgets.QStyleOptionButton()
+        button.rect = QtCore.QRect(QtCore.QPoint(0, 0), option.rect.size())
+        button.text = self.text
+        button.palette = option.palette
+        button.fontMetrics = option.fontMetrics
+        button.state = QtWidgets.QStyle.StateFlag.State_Enabled | QtWidgets.QStyle.StateFlag.State_Raised
+
+        style: QtWidgets.QStyle = widget.style() if widget else QtWidgets.QApplication.style()
+        painter: QtGui.QPainter = QtGui.QPainter(pixmap)
+        style.drawControl(QtWidgets.QStyle.ControlElement.CE_PushButton, button, painter, widget)
+        painter.end()
+
+        # 拖动列宽时会产生大量尺寸，超出上限后清空重建
+        if len(self.pixmaps) >= 64:
+            self.pixmaps.clear()
+
+        self.pixmaps[key] = pixmap
+        return pixmap
+
+    def sizeHint(
+        self,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex
+    ) -> QtCore.QSize:
+        """"""
+        width: int = option.fontMetrics.horizontalAdvance(self.text) + 20
+        height: int = option.fontMetrics.height() + 10
+        return QtCore.QSize(width, height)
+
+    def editorEvent(
+        self,
+        event: QtCore.QEvent,
+        model: QtCore.QAbstractItemModel,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex
+    ) -> bool:
+        """"""
+        if (
+            event.type() == QtCore.QEvent.Type.MouseButtonRelease
+            and option.rect.contains(event.position().toPoint())
+        ):
+            name: str = index.siblingAtColumn(self.name_column).data()
+            self.clicked.emit(name)
+            return True
+
+        return False
+
+
+class MonitorView(QtWidgets.QTableView):
+    """只在数据变化时调整对应行高，避免每次插入都重算整张表格"""
+
+    def init_row_resize(self) -> None:
+        """"""
+        self.verticalHeader().setSectionResizeMode(
+            QtWidgets.QHeaderView.ResizeMode.Fixed
+        )
+
+        # 列宽变化后自动换行的行高也会变化，等布局完成后再统一调整
+        self.resize_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(0)
+        self.resize_timer.timeout.connect(self.resizeRowsToContents)
+
+        self.horizontalHeader().sectionResized.connect(self.start_resize_timer)
+
+    def start_resize_timer(self) -> None:
+        """"""
+        self.resize_timer.start()
+
+
+class AlgoMonitor(MonitorView):
     """"""
     parameters_signal: QtCore.pyqtSignal = QtCore.pyqtSignal(Event)
     variables_signal: QtCore.pyqtSignal = QtCore.pyqtSignal(Event)
@@ -222,27 +442,40 @@ class AlgoMonitor(QtWidgets.QTableWidget):
         self.event_engine: EventEngine = event_engine
         self.mode_active: bool = mode_active
 
-        self.algo_cells: dict = {}
+        self.algo_rows: Dict[str, int] = {}     # algo_name:存储位置
+
+        self.pending_parameters: Dict[str, dict] = {}
+        self.pending_variables: Dict[str, dict] = {}
+        self.last_parameters: Dict[str, dict] = {}
+        self.last_variables: Dict[str, dict] = {}
 
         self.init_ui()
         self.register_event()
 
     def init_ui(self) -> None:
         """"""
+        self.flush_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(50)
+        self.flush_timer.timeout.connect(self.flush_pending)
+
         labels: list = [
             "",
             "算法",
             "参数",
             "状态"
         ]
-        self.setColumnCount(len(labels))
-        self.setHorizontalHeaderLabels(labels)
+        self.table_model: MonitorModel = MonitorModel(labels, self)
+        self.setModel(self.table_model)
+
+        self.stop_delegate: ButtonDelegate = ButtonDelegate("停止", 1, self)
+        self.stop_delegate.clicked.connect(self.stop_algo)
+        self.setItemDelegateForColumn(0, self.stop_delegate)
+
         self.verticalHeader().setVisible(False)
         self.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
 
-        self.verticalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.ResizeMode.ResizeToContents
-        )
+        self.init_row_resize()
 
         for column in range(2, 4):
             self.horizontalHeader().setSectionResizeMode(
@@ -268,24 +501,64 @@ class AlgoMonitor(QtWidgets.QTableWidget):
         """"""
         data: Any = event.data
         algo_name: str = data["algo_name"]
-        parameters: dict = data["parameters"]
 
-        cells: dict = self.get_algo_cells(algo_name)
-        text: str = to_text(parameters)
-        cells["parameters"].setText(text)
+        # 同一算法在刷新周期内只保留最新数据
+        self.pending_parameters[algo_name] = data["parameters"]
+        self.start_flush_timer()
 
     def process_variables_event(self, event: Event) -> None:
         """"""
         data: Any = event.data
         algo_name: str = data["algo_name"]
-        variables: dict = data["variables"]
 
-        cells: dict = self.get_algo_cells(algo_name)
-        variables_cell: Optional[QtWidgets.QTableWidgetItem] = cells["variables"]
+        self.pending_variables[algo_name] = data["variables"]
+        self.start_flush_timer()
+
+    def start_flush_timer(self) -> None:
+        """"""
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush_pending(self) -> None:
+        """将缓存的参数和变量一次性更新到表格"""
+        pending_parameters: Dict[str, dict] = self.pending_parameters
+        pending_variables: Dict[str, dict] = self.pending_variables
+        self.pending_parameters = {}
+        self.pending_variables = {}
+
+        for algo_name, parameters in pending_parameters.items():
+            self.update_parameters(algo_name, parameters)
+
+        for algo_name, variables in pending_variables.items():
+            self.update_variables(algo_name, variables)
+
+        updated: set = pending_parameters.keys() | pending_variables.keys()
+        for algo_name in updated:
+            ix: int = self.algo_rows[algo_name]
+            self.resizeRowToContents(self.table_model.get_row(ix))
+
+    def update_parameters(self, algo_name: str, parameters: dict) -> None:
+        """"""
+        # 数据没有变化时不更新表格
+        if parameters == self.last_parameters.get(algo_name, None):
+            return
+        self.last_parameters[algo_name] = parameters
+
+        ix: int = self.get_algo_row(algo_name)
+        text: str = to_text(parameters)
+        self.table_model.update_cell(ix, 2, text)
+
+    def update_variables(self, algo_name: str, variables: dict) -> None:
+        """"""
+        if variables == self.last_variables.get(algo_name, None):
+            return
+        self.last_variables[algo_name] = variables
+
+        ix: int = self.get_algo_row(algo_name)
         text: str = to_text(variables)
-        variables_cell.setText(text)
+        self.table_model.update_cell(ix, 3, text)
 
-        row: int = self.row(variables_cell)
+        row: int = self.table_model.get_row(ix)
         active: bool = variables["active"]
 
         if self.mode_active:
@@ -303,33 +576,15 @@ class AlgoMonitor(QtWidgets.QTableWidget):
         """"""
         self.algo_engine.stop_algo(algo_name)
 
-    def get_algo_cells(self, algo_name: str) -> dict:
+    def get_algo_row(self, algo_name: str) -> int:
         """"""
-        cells: dict = self.algo_cells.get(algo_name, None)
-
-        if not cells:
-            stop_func = partial(self.stop_algo, algo_name=algo_name)
-            stop_button: QtWidgets.QPushButton = QtWidgets.QPushButton("停止")
-            stop_button.clicked.connect(stop_func)
-
-            name_cell: QtWidgets.QTableWidgetItem = QtWidgets.QTableWidgetItem(algo_name)
-            parameters_cell: QtWidgets.QTableWidgetItem = QtWidgets.QTableWidgetItem()
-            variables_cell: QtWidgets.QTableWidgetItem = QtWidgets.QTableWidgetItem()
-
-            self.insertRow(0)
-            self.setCellWidget(0, 0, stop_button)
-            self.setItem(0, 1, name_cell)
-            self.setItem(0, 2, parameters_cell)
-            self.setItem(0, 3, variables_cell)
+        ix: Optional[int] = self.algo_rows.get(algo_name, None)
 
-            cells: dict = {
-                "name": name_cell,
-                "parameters": parameters_cell,
-                "variables": variables_cell
-            }
-            self.algo_cells[algo_name] = cells
+        if ix is None:
+            ix = self.table_model.insert_row(["", algo_name, "", ""])
+            self.algo_rows[algo_name] = ix
 
-        return cells
+        return ix
 
 
 class ActiveAlgoMonitor(AlgoMonitor):
@@ -348,7 +603,7 @@ class InactiveAlgoMonitor(AlgoMonitor):
         super().__init__(algo_engine, event_engine, False)
 
 
-class SettingMonitor(QtWidgets.QTableWidget):
+class SettingMonitor(MonitorView):
     """"""
     setting_signal: QtCore.pyqtSignal = QtCore.pyqtSignal(Event)
     use_signal: QtCore.pyqtSignal = QtCore.pyqtSignal(dict)
@@ -361,7 +616,6 @@ class SettingMonitor(QtWidgets.QTableWidget):
         self.event_engine: EventEngine = event_engine
 
         self.settings: dict = {}
-        self.setting_cells: dict = {}
 
         self.init_ui()
         self.register_event()
@@ -374,14 +628,21 @@ class SettingMonitor(QtWidgets.QTableWidget):
             "名称",
             "配置"
         ]
-        self.setColumnCount(len(labels))
-        self.setHorizontalHeaderLabels(labels)
+        self.table_model: MonitorModel = MonitorModel(labels, self)
+        self.setModel(self.table_model)
+
+        self.use_delegate: ButtonDelegate = ButtonDelegate("使用", 2, self)
+        self.use_delegate.clicked.connect(self.use_setting)
+        self.setItemDelegateForColumn(0, self.use_delegate)
+
+        self.remove_delegate: ButtonDelegate = ButtonDelegate("移除", 2, self)
+        self.remove_delegate.clicked.connect(self.remove_setting)
+        self.setItemDelegateForColumn(1, self.remove_delegate)
+
         self.verticalHeader().setVisible(False)
         self.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
 
-        self.verticalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.ResizeMode.ResizeToContents
-        )
+        self.init_row_resize()
 
         self.horizontalHeader().setSectionResizeMode(
             3,
@@ -401,51 +662,25 @@ class SettingMonitor(QtWidgets.QTableWidget):
         data: Any = event.data
         setting_name: str = data["setting_name"]
         setting: dict = data["setting"]
-        cells: dict = self.get_setting_cells(setting_name)
+        ix: Optional[int] = self.get_setting_row(setting_name)
 
         if setting:
-            self.settings[setting_name] = setting
+            if ix is None:
+                ix = self.table_model.insert_row(["", "", setting_name, ""])
 
-            cells["setting"].setText(to_text(setting))
+            self.settings[setting_name] = setting
+            self.table_model.update_cell(ix, 3, to_text(setting))
+            self.resizeRowToContents(self.table_model.get_row(ix))
         else:
             if setting_name in self.settings:
                 self.settings.pop(setting_name)
 
-            row: int = self.row(cells["setting"])
-            self.removeRow(row)
-
-            self.setting_cells.pop(setting_name)
+            if ix is not None:
+                self.table_model.remove_row(ix)
 
-    def get_setting_cells(self, setting_name: str) -> dict:
+    def get_setting_row(self, setting_name: str) -> Optional[int]:
         """"""
-        cells: Optional[dict] = self.setting_cells.get(setting_name, None)
-
-        if not cells:
-            use_func = partial(self.use_setting, setting_name=setting_name)
-            use_button: QtWidgets.QPushButton = QtWidgets.QPushButton("使用")
-            use_button.clicked.connect(use_func)
-
-            remove_func = partial(self.remove_setting,
-                                  setting_name=setting_name)
-            remove_button: QtWidgets.QPushButton = QtWidgets.QPushButton("移除")
-            remove_button.clicked.connect(remove_func)
-
-            name_cell: QtWidgets.QTableWidgetItem = QtWidgets.QTableWidgetItem(setting_name)
-            setting_cell: QtWidgets.QTableWidgetItem = QtWidgets.QTableWidgetItem()
-
-            self.insertRow(0)
-            self.setCellWidget(0, 0, use_button)
-            self.setCellWidget(0, 1, remove_button)
-            self.setItem(0, 2, name_cell)
-            self.setItem(0, 3, setting_cell)
-
-            cells: dict = {
-                "name": name_cell,
-                "setting": setting_cell
-            }
-            self.setting_cells[setting_name] = cells
-
-        return cells
+        return self.table_model.find(2, setting_name)
 
     def use_setting(self, setting_name: str) -> None:
         """"""
@@ -458,33 +693,43 @@ class SettingMonitor(QtWidgets.QTableWidget):
         self.algo_engine.remove_algo_setting(setting_name)
 
 
-class LogMonitor(QtWidgets.QTableWidget):
+class LogMonitor(MonitorView):
     """"""
     signal: QtCore.pyqtSignal = QtCore.pyqtSignal(Event)
 
-    def __init__(self, event_engine: EventEngine):
+    def __init__(self, event_engine: EventEngine, max_rows: int = 1000):
         """"""
         super().__init__()
 
         self.event_engine: EventEngine = event_engine
+        self.max_rows: int = max_rows
+
+        self.pending_logs: list = []
+
+        self.last_second: int = 0
+        self.last_timestamp: str = ""
 
         self.init_ui()
         self.register_event()
 
     def init_ui(self) -> None:
         """"""
+        self.flush_timer: QtCore.QTimer = QtCore.QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(100)
+        self.flush_timer.timeout.connect(self.flush_logs)
+
         labels: list = [
             "时间",
             "信息"
         ]
-        self.setColumnCount(len(labels))
-        self.setHorizontalHeaderLabels(labels)
+        self.table_model: MonitorModel = MonitorModel(labels, self)
+        self.setModel(self.table_model)
+
         self.verticalHeader().setVisible(False)
         self.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
 
-        self.verticalHeader().setSectionResizeMode(
-            QtWidgets.QHeaderView.ResizeMode.ResizeToContents
-        )
+        self.init_row_resize()
 
         self.horizontalHeader().setSectionResizeMode(
             1,
@@ -502,14 +747,29 @@ class LogMonitor(QtWidgets.QTableWidget):
         """"""
         log: Any = event.data
         msg = log.msg
-        timestamp: str = datetime.now().strftime("%H:%M:%S")
 
-        timestamp_cell: QtWidgets.QTableWidgetItem = QtWidgets.QTableWidgetItem(timestamp)
-        msg_cell: QtWidgets.QTableWidgetItem = QtWidgets.QTableWidgetItem(msg)
+        # 同一秒内的日志复用已格式化的时间
+        second: int = int(time.time())
+        if second != self.last_second:
+            self.last_second = second
+            self.last_timestamp = time.strftime("%H:%M:%S", time.localtime(second))
+        timestamp: str = self.last_timestamp
+
+        # 先缓存日志，由定时器批量插入表格
+        self.pending_logs.append([timestamp, msg])
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush_logs(self) -> None:
+        """"""
+        logs: list = self.pending_logs
+        self.pending_logs = []
+
+        self.table_model.insert_rows(logs)
+        self.table_model.trim_rows(self.max_rows)
 
-        self.insertRow(0)
-        self.setItem(0, 0, timestamp_cell)
-        self.setItem(0, 1, msg_cell)
+        for row in range(min(len(logs), self.max_rows)):
+            self.resizeRowToContents(row)
 
 
 class AlgoManager(QtWidgets.QWidget):
@@ -524,6 +784,7 @@ class AlgoManager(QtWidgets.QWidget):
         self.algo_engine: AlgoEngine = main_engine.get_engine(APP_NAME)
 
         self.algo_widgets: Dict[str, AlgoWidget] = {}
+        self.visible_widget: Optional[AlgoWidget] = None
 
         self.init_ui()
         self.algo_engine.init_engine()
@@ -546,6 +807,7 @@ class AlgoManager(QtWidgets.QWidget):
 
         for algo_template in self.algo_engine.algo_templates.values():
             widget: AlgoWidget = AlgoWidget(self.algo_engine, algo_template)
+            widget.hide()
             vbox.addWidget(widget)
 
             template_name: str = algo_template.__name__
@@ -599,11 +861,18 @@ class AlgoManager(QtWidgets.QWidget):
         ix: int = self.template_combo.currentIndex()
         current_name: Any = self.template_combo.itemData(ix)
 
-        for template_name, widget in self.algo_widgets.items():
-            if template_name == current_name:
-                widget.show()
-            else:
-                widget.hide()
+        # 只切换前后两个控件的显示状态
+        widget: Optional[AlgoWidget] = self.algo_widgets.get(current_name, None)
+        if widget is self.visible_widget:
+            return
+
+        if self.visible_widget:
+            self.visible_widget.hide()
+
+        if widget:
+            widget.show()
+
+        self.visible_widget = widget
 
     def use_setting(self, setting: dict) -> None:
         """"""
@@ -624,9 +893,6 @@ class AlgoManager(QtWidgets.QWidget):
 
 def to_text(data: dict) -> str:
     """将字典数据转化为字符串数据"""
-    buf: list = []
-    for key, value in data.items():
-        key = NAME_DISPLAY_MAP.get(key, key)
-        buf.append(f"{key}：{value}")
-    text = "，".join(buf)
+    get_display = NAME_DISPLAY_MAP.get
+    text: str = "，".join([f"{get_display(key, key)}：{value}" for key, value in data.items()])
     return text
@@ -172,6 +172,7 @@ class BacktestingEngine:
 
         self.logs.clear()
         self.daily_results.clear()
+        self.daily_df = None
 
     def set_parameters(
         self,
@@ -586,15 +587,12 @@ class BacktestingEngine:
 
         # Use multiprocessing pool for running backtesting with different setting
         # Force to use spawn method to create new process (instead of fork on Linux)
+        # Each worker process creates one engine with history data loaded in initializer
         ctx = multiprocessing.get_context("spawn")
-        pool = ctx.Pool(multiprocessing.cpu_count())
-
-        results = []
-        for setting in settings:
-            result = (pool.apply_async(optimize, (
-                target_name,
-                self.strategy_class,
-                setting,
+        pool = ctx.Pool(
+            multiprocessing.cpu_count(),
+            initializer=init_optimize_worker,
+            initargs=(
                 self.vt_symbol,
                 self.interval,
                 self.start,
@@ -606,7 +604,16 @@ class BacktestingEngine:
                 self.end,
                 self.mode,
                 self.inverse
-            )))
+            )
+        )
+
+        results = []
+        for setting in settings:
+            result = pool.apply_async(worker_optimize, (
+                target_name,
+                self.strategy_class,
+                setting
+            ))
             results.append(result)
 
         pool.close()
@@ -1261,6 +1268,71 @@ def optimize(
     return (str(setting), target_value, statistics)
 
 
+def init_optimize_worker(
+    vt_symbol: str,
+    interval: Interval,
+    start: datetime,
+    rate: float,
+    slippage: float,
+    size: float,
+    pricetick: float,
+    capital: int,
+    end: datetime,
+    mode: BacktestingMode,
+    inverse: bool
+) -> None:
+    """
+    Initializer of multiprocessing.pool worker, create the engine and load history data once
+    """
+    global worker_engine, worker_init_error
+
+    # Exception raised by pool initializer makes pool respawn workers forever,
+    # so keep it and raise it again when the worker runs a task.
+    try:
+        worker_engine = BacktestingEngine()
+
+        worker_engine.set_parameters(
+            vt_symbol=vt_symbol,
+            interval=interval,
+            start=start,
+            rate=rate,
+            slippage=slippage,
+            size=size,
+            pricetick=pricetick,
+            capital=capital,
+            end=end,
+            mode=mode,
+            inverse=inverse
+        )
+
+        worker_engine.load_data()
+    except Exception as e:
+        worker_init_error = e
+
+
+def worker_optimize(
+    target_name: str,
+    strategy_class: CtaTemplate,
+    setting: dict
+):
+    """
+    Function for running in multiprocessing.pool, reuse the engine of worker process
+    """
+    if worker_init_error:
+        raise worker_init_error
+
+    engine: BacktestingEngine = worker_engine
+    engine.clear_data()
+
+    engine.add_strategy(strategy_class, setting)
+    engine.run_backtesting()
+    engine.calculate_result()
+    statistics = engine.calculate_statistics(output=False)
+
+    target_value = statistics[target_name]
+    return (str(setting), target_value, statistics)
+
+
 @lru_cache(maxsize=1000000)
 def _ga_optimize(parameter_values: tuple):
     """"""
@@ -1317,6 +1389,10 @@ def load_tick_data(
     )
 
 
+# Optimization worker process global value
+worker_engine: BacktestingEngine = None
+worker_init_error: Exception = None
+
 # GA related global value
 ga_end = None
 ga_mode = None
@@ -1,16 +1,18 @@
 import importlib
+import os
+import sys
 import traceback
 from collections import defaultdict
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Type
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor
-from copy import copy
+from copy import copy, deepcopy
 from tzlocal import get_localzone
-from glob import glob
 from concurrent.futures import Future
 import threading
+import time
 from decimal import Decimal
 
 from howtrader.event import Event, EventEngine
@@ -73,6 +75,12 @@ STOP_STATUS_MAP: Dict[Status, StopOrderStatus] = {
 
 LOCAL_TZ = get_localzone()
 
+# 交易所名称集合，用于校验vt_symbol
+EXCHANGE_NAMES: FrozenSet[str] = frozenset(Exchange.__members__)
+
+# 策略数据写入文件的合并间隔（秒）
+SYNC_INTERVAL: float = 0.2
+
 
 class CtaEngine(BaseEngine):
     """"""
@@ -91,16 +99,19 @@ class CtaEngine(BaseEngine):
         self.strategy_data: dict = {}     # strategy_name: dict
 
         self.classes: dict = {}           # class_name: stategy_class
+        self.module_mtimes: Dict[str, float] = {}   # module_name: source file mtime
         self.strategies: dict = {}        # strategy_name: strategy
 
         self.symbol_strategy_map: defaultdict = defaultdict(
             list)                   # vt_symbol: strategy list
         self.orderid_strategy_map: Dict[str, CtaTemplate] = {}  # vt_orderid: strategy
         self.strategy_orderid_map: defaultdict = defaultdict(
-            set)                    # strategy_name: orderid list
+            set)                    # strategy_name: orderid set
 
         self.stop_order_count: int = 0   # for generating stop_orderid
         self.stop_orders: Dict[str, StopOrder] = {}       # stop_orderid: stop_order
+        self.symbol_stop_order_map: defaultdict = defaultdict(
+            dict)                   # vt_symbol: {stop_orderid: stop_order}
 
         self.init_executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1)
 
@@ -112,6 +123,9 @@ class CtaEngine(BaseEngine):
 
         self.database: BaseDatabase = get_database()
         self.sync_strategy_data_lock = threading.Lock()
+        self.sync_event: threading.Event = threading.Event()
+        self.sync_active: bool = False
+        self.sync_thread: threading.Thread = threading.Thread(target=self.run_sync_strategy_data, daemon=True)
 
     def init_engine(self) -> None:
         """"""
@@ -119,12 +133,23 @@ class CtaEngine(BaseEngine):
         self.load_strategy_setting()
         self.load_strategy_data()
         self.register_event()
+
+        self.sync_active = True
+        self.sync_thread.start()
+
         self.write_log("Initialize cta engine")
 
     def close(self) -> None:
         """"""
         self.stop_all_strategies()
 
+        # Stop sync thread, then save again in case an update arrived during its last write
+        if self.sync_active:
+            self.sync_active = False
+            self.sync_event.set()
+            self.sync_thread.join()
+            self.save_strategy_data()
+
     def register_event(self) -> None:
         """"""
         self.event_engine.register(EVENT_TICK, self.process_tick_event)
@@ -136,7 +161,7 @@ class CtaEngine(BaseEngine):
         """"""
         tick: TickData = event.data
 
-        strategies: list = self.symbol_strategy_map[tick.vt_symbol]
+        strategies: Optional[list] = self.symbol_strategy_map.get(tick.vt_symbol, None)
         if not strategies:
             return
 
@@ -157,9 +182,9 @@ class CtaEngine(BaseEngine):
             return
 
         # Remove vt_orderid if order is no longer active.
-        vt_orderids: list = self.strategy_orderid_map[strategy.strategy_name]
-        if order.vt_orderid in vt_orderids and not order.is_active():
-            vt_orderids.remove(order.vt_orderid)
+        if not order.is_active():
+            vt_orderids: set = self.strategy_orderid_map[strategy.strategy_name]
+            vt_orderids.discard(order.vt_orderid)
 
         # For server stop order, call strategy on_stop_order function
         if order.type == OrderType.STOP:
@@ -217,10 +242,13 @@ class CtaEngine(BaseEngine):
 
     def check_stop_order(self, tick: TickData) -> None:
         """"""
-        for stop_order in list(self.stop_orders.values()):
-            if stop_order.vt_symbol != tick.vt_symbol:
-                continue
+        symbol_stop_orders: Optional[Dict[str, StopOrder]] = self.symbol_stop_order_map.get(tick.vt_symbol, None)
+        if not symbol_stop_orders:
+            return
 
+        # Check trigger condition first, for strategy callbacks below may add or cancel stop orders
+        triggered_orders: List[StopOrder] = []
+        for stop_order in symbol_stop_orders.values():
             long_triggered = (
                 stop_order.direction == Direction.LONG and tick.last_price >= stop_order.price
             )
@@ -229,6 +257,17 @@ class CtaEngine(BaseEngine):
             )
 
             if long_triggered or short_triggered:
+                triggered_orders.append(stop_order)
+
+        if not triggered_orders:
+            return
+
+        # All stop orders here share the tick's vt_symbol
+        contract: Optional[ContractData] = self.main_engine.get_contract(tick.vt_symbol)
+
+        for stop_order in triggered_orders:
+            # Skip stop order already cancelled in callback of previous one
+            if stop_order.stop_orderid in symbol_stop_orders:
                 strategy: CtaTemplate = self.strategies[stop_order.strategy_name]
 
                 # To get excuted immediately after stop order is
@@ -245,8 +284,6 @@ class CtaEngine(BaseEngine):
                     else:
                         price = tick.bid_price_5
 
-                contract: Optional[ContractData] = self.main_engine.get_contract(stop_order.vt_symbol)
-
                 vt_orderids: list = self.send_limit_order(
                     strategy,
                     contract,
@@ -262,10 +299,10 @@ class CtaEngine(BaseEngine):
                 if vt_orderids:
                     # Remove from relation map.
                     self.stop_orders.pop(stop_order.stop_orderid)
+                    symbol_stop_orders.pop(stop_order.stop_orderid)
 
-                    strategy_vt_orderids: list = self.strategy_orderid_map[strategy.strategy_name]
-                    if stop_order.stop_orderid in strategy_vt_orderids:
-                        strategy_vt_orderids.remove(stop_order.stop_orderid)
+                    strategy_vt_orderids: set = self.strategy_orderid_map[strategy.strategy_name]
+                    strategy_vt_orderids.discard(stop_order.stop_orderid)
 
                     # Change stop order status to cancelled and update to strategy.
                     stop_order.status = StopOrderStatus.TRIGGERED
@@ -413,8 +450,9 @@ class CtaEngine(BaseEngine):
         )
 
         self.stop_orders[stop_orderid] = stop_order
+        self.symbol_stop_order_map[stop_order.vt_symbol][stop_orderid] = stop_order
 
-        vt_orderids: list = self.strategy_orderid_map[strategy.strategy_name]
+        vt_orderids: set = self.strategy_orderid_map[strategy.strategy_name]
         vt_orderids.add(stop_orderid)
 
         self.call_strategy_func(strategy, strategy.on_stop_order, stop_order)
@@ -445,10 +483,10 @@ class CtaEngine(BaseEngine):
 
         # Remove from relation map.
         self.stop_orders.pop(stop_orderid)
+        self.symbol_stop_order_map[stop_order.vt_symbol].pop(stop_orderid)
 
-        vt_orderids: list = self.strategy_orderid_map[strategy.strategy_name]
-        if stop_orderid in vt_orderids:
-            vt_orderids.remove(stop_orderid)
+        vt_orderids: set = self.strategy_orderid_map[strategy.strategy_name]
+        vt_orderids.discard(stop_orderid)
 
         # Change stop order status to cancelled and update to strategy.
         stop_order.status = StopOrderStatus.CANCELLED
@@ -509,11 +547,11 @@ class CtaEngine(BaseEngine):
         """
         Cancel all active orders of a strategy.
         """
-        vt_orderids: list = self.strategy_orderid_map[strategy.strategy_name]
+        vt_orderids: set = self.strategy_orderid_map[strategy.strategy_name]
         if not vt_orderids:
             return
 
-        for vt_orderid in copy(vt_orderids):
+        for vt_orderid in list(vt_orderids):
             self.cancel_order(strategy, vt_orderid)
 
     def get_engine_type(self) -> EngineType:
@@ -639,7 +677,7 @@ class CtaEngine(BaseEngine):
         Call function of a strategy and catch any exception raised.
         """
         try:
-            if params:
+            if params is not None:
                 func(params)
             else:
                 func()
@@ -670,7 +708,7 @@ class CtaEngine(BaseEngine):
             return
 
         _, exchange_str = vt_symbol.split(".")
-        if exchange_str not in Exchange.__members__:
+        if exchange_str not in EXCHANGE_NAMES:
             self.write_log("create strategy failed, exchange not found")
             return
 
@@ -802,7 +840,7 @@ class CtaEngine(BaseEngine):
 
         # Remove from active orderid map
         if strategy_name in self.strategy_orderid_map:
-            vt_orderids: list = self.strategy_orderid_map.pop(strategy_name)
+            vt_orderids: set = self.strategy_orderid_map.pop(strategy_name)
 
             # Remove vt_orderid strategy map
             for vt_orderid in vt_orderids:
@@ -829,10 +867,21 @@ class CtaEngine(BaseEngine):
         """
         Load strategy class from certain folder.
         """
-        for suffix in ["py", "pyd", "so"]:
-            pathname: str = str(path.joinpath(f"*.{suffix}"))
-            for filepath in glob(pathname):
-                filename = Path(filepath).stem
+        if not path.is_dir():
+            return
+
+        # scan the folder once and filter the module suffixes
+        with os.scandir(path) as entries:
+            for entry in entries:
+                filename, _, suffix = entry.name.rpartition(".")
+                if (
+                    suffix not in {"py", "pyd", "so"}
+                    or filename == "__init__"
+                    or entry.name.startswith(".")
+                    or not entry.is_file()
+                ):
+                    continue
+
                 name: str = f"{module_name}.{filename}"
                 self.load_strategy_class_from_module(name)
 
@@ -841,14 +890,20 @@ class CtaEngine(BaseEngine):
         Load strategy class from module file.
         """
         try:
+            imported: bool = module_name in sys.modules
             module: ModuleType = importlib.import_module(module_name)
 
-            # reload the model, in case any modification
-            importlib.reload(module)
+            # reload the module only if it was imported before and its file changed since then
+            mtime: float = os.path.getmtime(module.__file__)
+            if imported and self.module_mtimes.get(module_name, None) != mtime:
+                importlib.reload(module)
+            self.module_mtimes[module_name] = mtime
 
-            for name in dir(module):
-                value = getattr(module, name)
-                if (isinstance(value, type) and issubclass(value, CtaTemplate) and value is not CtaTemplate):
+            for name, value in vars(module).items():
+                if name.startswith("_") or not isinstance(value, type):
+                    continue
+
+                if issubclass(value, CtaTemplate) and value is not CtaTemplate:
                     self.classes[value.__name__] = value
         except:  # noqa
             msg: str = f"strategy module {module_name} failed to load，raise exception: \n{traceback.format_exc()}"
@@ -867,10 +922,46 @@ class CtaEngine(BaseEngine):
         data: dict = strategy.get_variables()
         data.pop("inited")      # Strategy status (inited, trading) should not be synced.
         data.pop("trading")
-        self.sync_strategy_data_lock.acquire()
-        self.strategy_data[strategy.strategy_name] = data
-        save_json(self.data_filename, self.strategy_data)
-        self.sync_strategy_data_lock.release()
+
+        # Snapshot variables here, sync thread dumps them while strategy keeps updating
+        data = deepcopy(data)
+
+        with self.sync_strategy_data_lock:
+            self.strategy_data[strategy.strategy_name] = data
+
+        # Let sync thread write the file, save directly if it is not running
+        if self.sync_active:
+            self.sync_event.set()
+        else:
+            self.save_strategy_data()
+
+    def save_strategy_data(self) -> None:
+        """
+        Save strategy data into json file.
+        """
+        with self.sync_strategy_data_lock:
+            strategy_data: dict = copy(self.strategy_data)
+
+        save_json(self.data_filename, strategy_data)
+
+    def run_sync_strategy_data(self) -> None:
+        """
+        Save strategy data in background, updates within SYNC_INTERVAL are written once.
+        """
+        while self.sync_active:
+            self.sync_event.wait()
+
+            if self.sync_active:
+                time.sleep(SYNC_INTERVAL)
+
+            self.sync_event.clear()
+
+            # Keep sync thread alive if saving failed, data will be saved again on next update
+            try:
+                self.save_strategy_data()
+            except Exception:
+                msg: str = f"failed to save strategy data: \n{traceback.format_exc()}"
+                self.write_log(msg)
 
     def get_all_strategy_class_names(self) -> list:
         """
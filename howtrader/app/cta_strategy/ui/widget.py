@@ -1,3 +1,5 @@
+from typing import Any, Callable, Dict
+
 from howtrader.event import Event, EventEngine
 from howtrader.trader.engine import MainEngine
 from howtrader.trader.ui import QtCore, QtGui, QtWidgets
@@ -17,6 +19,12 @@ from ..base import (
 from ..engine import CtaEngine
 
 
+# Converters from edit text to parameter value, bool needs special handling
+SETTING_CONVERTERS: Dict[type, Callable[[str], Any]] = {
+    bool: lambda text: text == "True"
+}
+
+
 class CtaManager(QtWidgets.QWidget):
     """"""
 
@@ -443,7 +451,7 @@ class SettingEditor(QtWidgets.QDialog):
 
             form.addRow(f"{name} {type_}", edit)
 
-            self.edits[name] = (edit, type_)
+            self.edits[name] = (edit, SETTING_CONVERTERS.get(type_, type_))
 
         button: QtWidgets.QPushButton = QtWidgets.QPushButton(button_text)
         button.clicked.connect(self.accept)
@@ -468,17 +476,7 @@ class SettingEditor(QtWidgets.QDialog):
             setting["class_name"] = self.class_name
 
         for name, tp in self.edits.items():
-            edit, type_ = tp
-            value_text = edit.text()
-
-            if type_ == bool:
-                if value_text == "True":
-                    value = True
-                else:
-                    value = False
-            else:
-                value = type_(value_text)
-
-            setting[name] = value
+            edit, convert = tp
+            setting[name] = convert(edit.text())
 
         return setting
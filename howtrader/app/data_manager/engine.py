@@ -1,6 +1,6 @@
 import csv
-from datetime import datetime
-from typing import List, Tuple
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
 
 from pytz import timezone
 
@@ -9,8 +9,11 @@ from howtrader.trader.constant import Interval, Exchange
 from howtrader.trader.object import BarData, HistoryRequest
 from howtrader.trader.database import BaseDatabase, get_database, BarOverview, DB_TZ
 
+
 APP_NAME = "DataManager"
 
+DOWNLOAD_WINDOW: timedelta = timedelta(days=30)
+
 
 class ManagerEngine(BaseEngine):
     """"""
@@ -189,28 +192,55 @@ class ManagerEngine(BaseEngine):
         """
         Query bar data from datafeed.
         """
-        req = HistoryRequest(
-            symbol=symbol,
-            exchange=exchange,
-            interval=interval,
-            start=start,
-            end=datetime.now(DB_TZ)
-        )
-
         vt_symbol = f"{symbol}.{exchange.value}"
         contract = self.main_engine.get_contract(vt_symbol)
 
         # If history data provided in gateway, then query
-        if contract and contract.history_data:
-            data = self.main_engine.query_history(
+        if not contract or not contract.history_data:
+            return 0
+
+        if not start.tzinfo:
+            start = DB_TZ.localize(start)
+        end: datetime = datetime.now(DB_TZ)
+
+        # Query and save data window by window, so that all bars are not held in memory at once
+        count: int = 0
+        last_dt: Optional[datetime] = None
+
+        while start < end:
+            window_end: datetime = min(start + DOWNLOAD_WINDOW, end)
+
+            req = HistoryRequest(
+                symbol=symbol,
+                exchange=exchange,
+                interval=interval,
+                start=start,
+                end=window_end
+            )
+            data: List[BarData] = self.main_engine.query_history(
                 req, contract.gateway_name
             )
 
+            # Empty window after data started means the query failed, stop here
+            # to keep saved data contiguous, later update resumes from the last bar.
+            if not data:
+                if last_dt:
+                    break
+                start = window_end
+                continue
+
+            # Bars on the boundary of adjacent windows may be returned twice
+            if last_dt:
+                data = [bar for bar in data if bar.datetime > last_dt]
+
             if data:
                 self.database.save_bar_data(data)
-                return(len(data))
+                count += len(data)
+                last_dt = data[-1].datetime
 
-        return 0
+            start = window_end
+
+        return count
 
     def download_tick_data(
         self,
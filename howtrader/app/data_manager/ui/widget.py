@@ -596,8 +596,9 @@ class DownloadDialog(QtWidgets.QDialog):
     def download(self):
         """"""
         symbol = self.symbol_edit.text()
-        exchange = Exchange(self.exchange_combo.currentData())
-        interval = Interval(self.interval_combo.currentData())
+        # combo boxes store the enum members as item data, no need to coerce again
+        exchange: Exchange = self.exchange_combo.currentData()
+        interval: Interval = self.interval_combo.currentData()
 
         start_date = self.start_date_edit.date()
         start = datetime(start_date.year(), start_date.month(), start_date.day())
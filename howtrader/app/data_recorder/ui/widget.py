@@ -1,4 +1,4 @@
-from datetime import datetime
+import time
 from typing import Any, List
 
 from howtrader.event import Event, EventEngine
@@ -127,7 +127,7 @@ class RecorderManager(QtWidgets.QWidget):
 
     def process_log_event(self, event: Event) -> None:
         """"""
-        timestamp: str = datetime.now().strftime("%H:%M:%S")
+        timestamp: str = time.strftime("%H:%M:%S")
         msg: str = f"{timestamp}\t{event.data}"
         self.log_edit.append(msg)
 
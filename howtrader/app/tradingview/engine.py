@@ -3,7 +3,7 @@ import traceback
 from collections import defaultdict
 from pathlib import Path
 from types import ModuleType
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Type
 from concurrent.futures import ThreadPoolExecutor
 from copy import copy
 from glob import glob
@@ -46,6 +46,8 @@ from howtrader.trader.utility import load_json, save_json, extract_vt_symbol, ro
 APP_NAME = "TradingView"
 from .template import TVTemplate
 
+EXCHANGE_NAMES: FrozenSet[str] = frozenset(Exchange.__members__)
+
 
 class TVEngine(BaseEngine):
     """TradingView Engine"""
@@ -316,7 +318,7 @@ class TVEngine(BaseEngine):
             return
 
         _, exchange_str = vt_symbol.split(".")
-        if exchange_str not in Exchange.__members__:
+        if exchange_str not in EXCHANGE_NAMES:
             self.write_log("create strategy failed, exchange not support")
             return
 
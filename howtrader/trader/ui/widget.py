@@ -6,7 +6,7 @@ import csv
 from datetime import datetime
 import platform
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from copy import copy
 from tzlocal import get_localzone
 
@@ -202,9 +202,20 @@ class BaseMonitor(QtWidgets.QTableWidget):
     data_key: str = ""
     sorting: bool = False
     headers: dict = {}
+    _header_fields: tuple = ()
 
     signal: QtCore.Signal = QtCore.Signal(Event)
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Cache (header, cell type, update) of each column for inserting rows.
+        """
+        super().__init_subclass__(**kwargs)
+        cls._header_fields = tuple(
+            (header, setting["cell"], setting["update"])
+            for header, setting in cls.headers.items()
+        )
+
     def __init__(self, main_engine: MainEngine, event_engine: EventEngine) -> None:
         """"""
         super(BaseMonitor, self).__init__()
@@ -293,14 +304,12 @@ class BaseMonitor(QtWidgets.QTableWidget):
         self.insertRow(0)
 
         row_cells: dict = {}
-        for column, header in enumerate(self.headers.keys()):
-            setting: dict = self.headers[header]
-
+        for column, (header, cell_type, update) in enumerate(self._header_fields):
             content = data.__getattribute__(header)
-            cell: QtWidgets.QTableWidgetItem = setting["cell"](content, data)
+            cell: QtWidgets.QTableWidgetItem = cell_type(content, data)
             self.setItem(0, column, cell)
 
-            if setting["update"]:
+            if update:
                 row_cells[header] = cell
 
         if self.data_key:
@@ -334,24 +343,31 @@ class BaseMonitor(QtWidgets.QTableWidget):
         if not path:
             return
 
-        with open(path, "w") as f:
+        with open(path, "w", buffering=1024 * 1024) as f:
             writer = csv.writer(f, lineterminator="\n")
 
             headers: list = [d["display"] for d in self.headers.values()]
             writer.writerow(headers)
+            writer.writerows(self.get_rows_text())
 
-            for row in range(self.rowCount()):
-                if self.isRowHidden(row):
-                    continue
-
-                row_data: list = []
-                for column in range(self.columnCount()):
-                    item: QtWidgets.QTableWidgetItem = self.item(row, column)
-                    if item:
-                        row_data.append(str(item.text()))
-                    else:
-                        row_data.append("")
-                writer.writerow(row_data)
+    def get_rows_text(self) -> Iterator[List[str]]:
+        """
+        Yield text of each visible row in table.
+        """
+        columns: range = range(self.columnCount())
+
+        for row in range(self.rowCount()):
+            if self.isRowHidden(row):
+                continue
+
+            row_data: List[str] = []
+            for column in columns:
+                item: QtWidgets.QTableWidgetItem = self.item(row, column)
+                if item:
+                    row_data.append(item.text())
+                else:
+                    row_data.append("")
+            yield row_data
 
     def contextMenuEvent(self, event: QtGui.QContextMenuEvent) -> None:
         """